@@ -4,6 +4,13 @@
 __version__ = "1.3.1"
 __author__ = "Marouan Bouchettoy"
 
-from bmdb.cli import main
+__all__ = ["main"]
 
-__all__ = ["main"]
\ No newline at end of file
+
+def __getattr__(name):
+    # Import the CLI on first use so `import bmdb` (e.g. to read __version__)
+    # doesn't pull in click and the database stack.
+    if name == "main":
+        from bmdb.cli import main
+        return main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
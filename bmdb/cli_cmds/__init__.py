@@ -0,0 +1 @@
+"""BMDB CLI commands, one module per command, loaded on demand by bmdb.cli.main"""
@@ -0,0 +1,26 @@
+import click
+
+from bmdb.cli import MODELS_FILE, load_models, save_models
+
+@click.command("add-fields")
+@click.argument("model")
+@click.argument("fields", nargs=-1)
+@click.option("--unique", multiple=True)
+def add_fields(model, fields, unique):
+    """Add fields to a model"""
+    if len(fields) % 2 != 0:
+        click.echo("✗ Fields must come in name-type pairs (e.g., 'name String age Integer')")
+        return
+    data = load_models()
+    if model not in data["models"]:
+        click.echo(f"✗ Model '{model}' not found. Create it first with 'bmdb create-model {model}'")
+        return
+    uniques = set(unique)
+    for i in range(0, len(fields), 2):
+        fname = fields[i]
+        ftype = fields[i+1]
+        defn = ftype + (" @unique" if fname in uniques else "")
+        data["models"][model]["fields"][fname] = defn
+    save_models(data)
+    click.echo(f"✓ Fields added to model '{model}'")
+    click.echo(f"  Updated {MODELS_FILE}")
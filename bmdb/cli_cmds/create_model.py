@@ -0,0 +1,15 @@
+import click
+
+from bmdb.cli import MODELS_FILE, load_models, save_models
+
+@click.command("create-model")
+@click.argument("name")
+def create_model(name):
+    """Create a new model"""
+    data = load_models()
+    if name in data["models"]:
+        click.echo(f"✗ Model '{name}' already exists")
+        return
+    data["models"][name] = {"fields": {}}
+    save_models(data)
+    click.echo(f"✓ Model '{name}' created in {MODELS_FILE}")
@@ -0,0 +1,11 @@
+from pathlib import Path
+import click
+
+from bmdb.cli import MODELS_FILE, generate_models
+
+@click.command("generate")
+def generate():
+    """Generate Python models from models.bmdb"""
+    click.echo(f"Current directory: {Path.cwd()}")
+    click.echo(f"Looking for models.bmdb at: {MODELS_FILE}")
+    generate_models()
@@ -0,0 +1,22 @@
+import click
+
+from bmdb.cli import MODELS_FILE, load_models
+
+@click.command("list-models")
+def list_models():
+    """List all defined models"""
+    data = load_models()
+    if not data.get("models"):
+        click.echo("No models defined in models.bmdb")
+        return
+    
+    # Collect the listing and write it in one go rather than a line at a time
+    lines = [f"Models defined in {MODELS_FILE}:", "=" * 50]
+    for model_name, model_data in data["models"].items():
+        lines.append(f"\n📋 {model_name}:")
+        fields = model_data.get("fields", {})
+        if fields:
+            lines.extend(f"  ├─ {field_name}: {field_type}" for field_name, field_type in fields.items())
+        else:
+            lines.append("  └─ (no fields defined yet)")
+    click.echo("\n".join(lines))
@@ -0,0 +1,152 @@
+import os
+import time
+import click
+
+from bmdb.cli import OUT_DIR
+
+@click.command("migrate")
+@click.option("--safe", is_flag=True, help="Safe mode (won't drop columns)")
+@click.option("--dry-run", is_flag=True, help="Show what would change without applying")
+def migrate_schema(safe, dry_run):
+    """Update existing database schema to match models (add/modify columns)"""
+    try:
+        from dotenv import load_dotenv
+        from sqlalchemy import create_engine, inspect, text
+
+        load_dotenv()
+        db_url = os.getenv("DB_CONNECTION", "").strip('"')
+        if not db_url:
+            click.echo("✗ Error: DB_CONNECTION not found in .env")
+            return
+        
+        # Import models
+        models_path = OUT_DIR / "models.py"
+        if not models_path.exists():
+            click.echo("✗ Generated models not found. Run 'bmdb generate' first.")
+            return
+        
+        import importlib.util
+        spec = importlib.util.spec_from_file_location("generated_models", str(models_path))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        Base = module.Base
+        
+        engine = create_engine(db_url)
+        inspector = inspect(engine)
+        
+        click.echo("🔍 Analyzing database schema...")
+        
+        changes = []
+        
+        for table_name, table in Base.metadata.tables.items():
+            if table_name not in inspector.get_table_names():
+                changes.append(f"➕ CREATE TABLE {table_name}")
+                continue
+            
+            existing_columns = {col['name']: col for col in inspector.get_columns(table_name)}
+            model_columns = {col.name: col for col in table.columns}
+            
+            # Check for new columns
+            for col_name, model_col in model_columns.items():
+                if col_name not in existing_columns:
+                    col_type = str(model_col.type)
+                    changes.append(f"  ➕ ADD COLUMN {table_name}.{col_name} ({col_type})")
+            
+            # Check for type changes
+            for col_name, model_col in model_columns.items():
+                if col_name in existing_columns:
+                    existing_type = str(existing_columns[col_name]['type'])
+                    model_type = str(model_col.type)
+                    if existing_type != model_type:
+                        changes.append(f"  🔄 MODIFY {table_name}.{col_name} ({existing_type} → {model_type})")
+            
+            # Check for columns to drop
+            if not safe:
+                for col_name in existing_columns.keys():
+                    if col_name not in model_columns:
+                        changes.append(f"  🗑️  DROP COLUMN {table_name}.{col_name}")
+        
+        if not changes:
+            click.echo("✅ Database schema is already up to date!")
+            return
+        
+        click.echo("\n".join(["\n📋 Proposed changes:", *(f"  {change}" for change in changes)]))
+        
+        if dry_run:
+            click.echo("\n✅ Dry run complete - no changes were made.")
+            return
+        
+        if changes and click.confirm("\nApply these changes to the database?"):
+            # Apply changes
+            with engine.begin() as conn:
+                for table_name, table in Base.metadata.tables.items():
+                    if table_name not in inspector.get_table_names():
+                        table.create(conn)
+                        click.echo(f"✅ Created table: {table_name}")
+                        continue
+                    
+                    # Handle column changes
+                    existing_columns = {col['name']: col for col in inspector.get_columns(table_name)}
+                    model_columns = {col.name: col for col in table.columns}
+                    
+                    # Add new columns
+                    for col_name, model_col in model_columns.items():
+                        if col_name not in existing_columns:
+                            col_type = model_col.type.compile(engine.dialect)
+                            sql = f"ALTER TABLE {table_name} ADD COLUMN {col_name} {col_type}"
+                            conn.execute(text(sql))
+                            click.echo(f"✅ Added column: {table_name}.{col_name}")
+
+                    for col_name in existing_columns:
+                        if col_name not in model_columns and not safe:
+                            sql = f"ALTER TABLE {table_name} DROP COLUMN {col_name}"
+                            conn.execute(text(sql))
+                            click.echo(f"✅ Dropped column: {table_name}.{col_name}")
+
+                    # For type changes (very basic – only works for some databases)
+                    for col_name, model_col in model_columns.items():
+                        if col_name in existing_columns:
+                            existing_type = str(existing_columns[col_name]['type'])
+                            model_type = str(model_col.type.compile(engine.dialect))
+                            if existing_type != model_type:
+                                if "postgresql" in db_url.lower():
+                                    sql = f"ALTER TABLE {table_name} ALTER COLUMN {col_name} TYPE {model_type}"
+                                    conn.execute(text(sql))
+
+                                elif "mysql" in db_url.lower() or "mariadb" in db_url.lower():
+                                    sql = f"ALTER TABLE {table_name} MODIFY COLUMN {col_name} {model_type}"
+                                    conn.execute(text(sql))
+
+                                elif "sqlite" in db_url.lower():
+                                    click.echo(f"SQLite: recreating table {table_name} to change {col_name} type")
+
+                                    temp_table = f"{table_name}_temp_{int(time.time())}"
+
+                                    # Create temp table with new schema
+                                    temp_table_obj = Base.metadata.tables[table_name].to_metadata(
+                                        Base.metadata, name=temp_table
+                                    )
+                                    temp_table_obj.create(conn)
+
+                                    # Copy data
+                                    columns = ", ".join(c.name for c in Base.metadata.tables[table_name].columns)
+                                    conn.execute(text(
+                                        f"INSERT INTO {temp_table} ({columns}) SELECT {columns} FROM {table_name}"
+                                    ))
+
+                                    # Drop old → rename new
+                                    conn.execute(text(f"DROP TABLE {table_name}"))
+                                    conn.execute(text(f"ALTER TABLE {temp_table} RENAME TO {table_name}"))
+
+                                else:
+                                    click.echo("✗ Type change not supported for this database")
+                                    continue
+
+                                click.echo(f"✅ Modified column: {table_name}.{col_name}")
+        
+        click.echo("\n✅ Schema migration completed!")
+        
+    except Exception as e:
+        click.echo(f"✗ Migration failed: {e}")
+        import traceback
+        traceback.print_exc()
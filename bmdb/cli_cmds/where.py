@@ -0,0 +1,15 @@
+from pathlib import Path
+import sys
+import click
+
+from bmdb.cli import MODELS_FILE, OUT_DIR
+
+@click.command("where")
+def where():
+    """Show current paths and locations"""
+    click.echo("📁 Current paths:")
+    click.echo(f"  Current directory: {Path.cwd()}")
+    click.echo(f"  MODELS_FILE: {MODELS_FILE}")
+    click.echo(f"  OUT_DIR: {OUT_DIR}")
+    click.echo(f"  Python executable: {sys.executable}")
+    click.echo(f"  Python path: {sys.path[:3]}")
@@ -0,0 +1,165 @@
+"""Source templates for the files written by ``bmdb generate``
+
+Kept as plain module constants so the static parts of the generated code
+are compiled once into this module's bytecode instead of being rebuilt
+line by line on every run.
+"""
+
+# Header of models.py: imports, engine/session setup and the CRUD mixin.
+# The model classes are appended after it by generate_models.
+MODELS_HEADER = """\
+# -*- coding: utf-8 -*-
+# Generated by BMDB - DO NOT EDIT MANUALLY
+# ======================================================================
+
+from sqlalchemy import Column, Integer, String, Text, Float, Boolean, Date, DateTime, ForeignKey, create_engine, inspect
+from sqlalchemy.orm import declarative_base, sessionmaker, Session
+from sqlalchemy.orm import relationship
+from contextlib import contextmanager
+import os
+from dotenv import load_dotenv
+from pathlib import Path
+
+Base = declarative_base()
+
+# Load DB connection from .env at runtime
+# Try to find .env in current directory first
+env_path = Path.cwd() / '.env'
+if env_path.exists():
+    load_dotenv(dotenv_path=env_path)
+else:
+    load_dotenv()
+
+DB_URL = os.getenv('DB_CONNECTION', '').strip('"')
+engine = create_engine(DB_URL, echo=False) if DB_URL else None
+# expire_on_commit=False keeps loaded attributes readable once the session closes
+SessionLocal = sessionmaker(bind=engine, expire_on_commit=False) if engine else None
+
+@contextmanager
+def _session():
+    '''Open a session, commit on success, roll back on error, always close'''
+    if not SessionLocal:
+        raise RuntimeError('Database not configured. Check your .env file')
+    session = SessionLocal()
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+class ModelMixin:
+    '''Mixin to add CRUD methods to models'''
+
+    def save(self):
+        '''Create or update this instance'''
+        with _session() as session:
+            session.add(self)
+            session.flush()
+            session.refresh(self)
+        return self
+
+    def delete(self):
+        '''Delete this instance'''
+        with _session() as session:
+            session.delete(self)
+        return True
+
+    @classmethod
+    def bulk_save(cls, objs):
+        '''Insert or update many instances in one transaction (primary keys are not fetched back)'''
+        with _session() as session:
+            session.bulk_save_objects(objs)
+        return objs
+
+    @classmethod
+    def bulk_insert_mappings(cls, rows):
+        '''Insert many records from dicts in one transaction, without building instances'''
+        with _session() as session:
+            session.bulk_insert_mappings(cls, rows)
+
+    @classmethod
+    def get(cls, id):
+        '''Get record by ID'''
+        with _session() as session:
+            return session.query(cls).filter(cls.id == id).first()
+
+    @classmethod
+    def all(cls):
+        '''Get all records'''
+        with _session() as session:
+            return session.query(cls).all()
+
+    @classmethod
+    def _column_map(cls):
+        '''Map attribute names to mapped columns; built once per class on first use'''
+        # Look in cls.__dict__ so a subclass never reuses its parent's map
+        columns = cls.__dict__.get('_columns')
+        if columns is None:
+            columns = dict(inspect(cls).columns.items())
+            cls._columns = columns
+        return columns
+
+    @classmethod
+    def _build_query(cls, session, filters):
+        '''Query cls narrowed by column == value filters; unknown names are ignored'''
+        columns = cls._column_map()
+        query = session.query(cls)
+        for key, value in filters.items():
+            column = columns.get(key)
+            if column is not None:
+                query = query.filter(column == value)
+        return query
+
+    @classmethod
+    def filter(cls, **kwargs):
+        '''Filter records by field values'''
+        with _session() as session:
+            return cls._build_query(session, kwargs).all()
+
+    @classmethod
+    def first(cls, **kwargs):
+        '''Get first record matching filters'''
+        with _session() as session:
+            return cls._build_query(session, kwargs).first()
+
+    @classmethod
+    def count(cls, **kwargs):
+        '''Count records matching filters'''
+        with _session() as session:
+            return cls._build_query(session, kwargs).count()
+
+    @classmethod
+    def _column_name_tuple(cls):
+        '''Names of the columns in cls.__table__; built once per class on first use'''
+        names = cls.__dict__.get('_column_names')
+        if names is None:
+            names = tuple(column.name for column in cls.__table__.columns)
+            cls._column_names = names
+        return names
+
+    def to_dict(self):
+        '''Convert model instance to dictionary'''
+        return {name: getattr(self, name) for name in self._column_name_tuple()}
+"""
+
+INIT_PY = '''\
+"""
+Generated models package.
+"""
+from .models import Base, ModelMixin
+'''
+
+MIGRATE_PY = """\
+# -*- coding: utf-8 -*-
+# migrate.py - run manually or use bmdb migrate
+from .models import Base, engine
+
+if engine:
+    Base.metadata.create_all(engine)
+    print('Tables created')
+else:
+    print('Error: DB_CONNECTION not set')\
+"""
@@ -4,6 +4,15 @@ Example usage of BMDB
 
 from bmdb import BMDB, Database, Model, Field
 
+# Define the model once at module level so example_models() reuses it
+class User(Model):
+    __tablename__ = "users"
+    
+    id = Field("INTEGER", primary_key=True, auto_increment=True)
+    name = Field("TEXT", nullable=False)
+    email = Field("TEXT", unique=True)
+    age = Field("INTEGER")
+
 def example_basic():
     """Basic usage example"""
     print("=== Basic BMDB Example ===")
@@ -81,15 +90,6 @@ def example_models():
     """ORM Models example"""
     print("\n=== ORM Models Example ===")
     
-    # Define a model
-    class User(Model):
-        __tablename__ = "users"
-        
-        id = Field("INTEGER", primary_key=True, auto_increment=True)
-        name = Field("TEXT", nullable=False)
-        email = Field("TEXT", unique=True)
-        age = Field("INTEGER")
-    
     # Set up database
     db = BMDB("sqlite:///models.db")
     Model.set_database(db)
@@ -0,0 +1,74 @@
+import json
+import os
+
+import pytest
+
+from bmdb import cli
+
+
+@pytest.fixture(autouse=True)
+def project(tmp_path, monkeypatch):
+    """Point models.bmdb and the models cache at a throwaway directory"""
+    models_file = tmp_path / "bmdb" / "models" / "models.bmdb"
+    monkeypatch.setattr(cli, "MODELS_FILE", models_file)
+    monkeypatch.setattr(cli, "CACHE_DIR", tmp_path / "cache")
+    cli._load_models_cached.cache_clear()
+    yield models_file
+    cli._load_models_cached.cache_clear()
+
+
+def cache_file(models_file):
+    return cli._models_cache_file(str(models_file))
+
+
+def test_cache_is_written_and_reused(project):
+    data = {"models": {"User": {"fields": {"name": "String"}}}}
+    cli.save_models(data)
+    assert cache_file(project).exists()
+    assert not (project.parent / "models.bmdb.cache.json").exists()
+
+    # A cache whose hash matches is served without parsing the YAML
+    cached = json.loads(cache_file(project).read_text(encoding="utf-8"))
+    cached["data"]["models"]["User"]["fields"]["name"] = "Text"
+    cache_file(project).write_text(json.dumps(cached), encoding="utf-8")
+    cli._load_models_cached.cache_clear()
+    assert cli.load_models()["models"]["User"]["fields"]["name"] == "Text"
+
+
+def test_hash_mismatch_reparses_yaml(project):
+    cli.save_models({"models": {"User": {"fields": {"age": "Integer"}}}})
+    stat = project.stat()
+
+    # Same size, same mtime: only the content hash can tell the edit apart
+    project.write_text(project.read_text(encoding="utf-8").replace("Integer", "Decimal"), encoding="utf-8")
+    os.utime(project, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    cli._load_models_cached.cache_clear()
+
+    assert cli.load_models()["models"]["User"]["fields"]["age"] == "Decimal"
+
+
+def test_non_string_keys_are_not_cached(project):
+    project.parent.mkdir(parents=True)
+    project.write_text("models:\n  User:\n    fields:\n      1: String\n", encoding="utf-8")
+
+    first = cli.load_models()
+    cli._load_models_cached.cache_clear()
+    second = cli.load_models()
+
+    assert first["models"]["User"]["fields"] == {1: "String"}
+    assert second == first
+    assert not cache_file(project).exists()
+
+
+def test_unwritable_cache_dir_is_skipped(project, tmp_path, monkeypatch):
+    # A regular file where the cache directory should be: mkdir fails even as root
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("", encoding="utf-8")
+    monkeypatch.setattr(cli, "CACHE_DIR", blocker / "bmdb")
+
+    data = {"models": {"Post": {"fields": {"title": "String"}}}}
+    cli.save_models(data)
+    cli._load_models_cached.cache_clear()
+
+    assert cli.load_models() == data
+    assert list(tmp_path.glob("**/*.tmp")) == []